@@ -2,6 +2,7 @@
 
 import logging
 import asyncio
+import threading
 #
 from concurrent.futures import ThreadPoolExecutor
 from typing import List, Any, cast, Optional
@@ -30,16 +31,30 @@ def add_fastapi_endpoint(
     ):
     """Add FastAPI endpoint with configurable ThreadPoolExecutor size"""
     executor = ThreadPoolExecutor(max_workers=max_workers)
+    thread_local = threading.local()
 
     def run_handler_in_thread(request: Request, sdk: CopilotKitRemoteEndpoint):
-        # Run the handler coroutine in the event loop        
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        return loop.run_until_complete(handler(request, sdk))
+        # Run the handler coroutine in the event loop of this worker thread,
+        # creating it on first use so it is reused across requests
+        loop = getattr(thread_local, "loop", None)
+        if loop is None:
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            thread_local.loop = loop
+        try:
+            return loop.run_until_complete(handler(request, sdk))
+        finally:
+            # cancel whatever the handler left pending, so that it doesn't
+            # run during a later, unrelated request on this thread
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
 
     async def make_handler(request: Request):
         if use_thread_pool:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             future = loop.run_in_executor(executor, run_handler_in_thread, request, sdk)
             return await future
         return await handler(request, sdk)
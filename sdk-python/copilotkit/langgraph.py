@@ -35,6 +35,16 @@ def copilotkit_messages_to_langchain(
     def _copilotkit_messages_to_langchain(messages: List[Message]) -> List[BaseMessage]:
         result = []
         processed_action_executions = set()
+
+        # Index the messages by id and parent message id, so finding all tool
+        # calls for a message doesn't rescan the whole history
+        tool_calls_by_message_id = {}
+        for msg in cast(Any, messages):
+            tool_calls_by_message_id.setdefault(msg["id"], []).append(msg)
+            parent_message_id = msg.get("parentMessageId")
+            if parent_message_id is not None and parent_message_id != msg["id"]:
+                tool_calls_by_message_id.setdefault(parent_message_id, []).append(msg)
+
         for message in cast(Any, messages):
             if message["type"] == "TextMessage":
                 if message["role"] == "user":
@@ -66,12 +76,8 @@ def copilotkit_messages_to_langchain(
 
                     processed_action_executions.add(message_id)
 
-                    all_tool_calls = []
-
                     # Find all tool calls for this message
-                    for msg in messages:
-                        if msg.get("parentMessageId", None) == message_id or msg["id"] == message_id:
-                            all_tool_calls.append(msg)
+                    all_tool_calls = tool_calls_by_message_id.get(message_id, [])
 
                     tool_calls = [{
                         "name": t["name"],
@@ -107,6 +113,7 @@ def langchain_messages_to_copilotkit(
     Convert LangChain messages to CopilotKit messages
     """
     result = []
+    results_dict = {}
     tool_call_names = {}
 
     for message in messages:
@@ -157,16 +164,14 @@ def langchain_messages_to_copilotkit(
                     "parentMessageId": message.id,
                 })
         elif isinstance(message, ToolMessage):
-            result.append({
+            # map tool call ids to their result messages, these are placed
+            # after the corresponding tool call below
+            results_dict[message.tool_call_id] = {
                 "actionExecutionId": message.tool_call_id,
                 "actionName": tool_call_names.get(message.tool_call_id, message.name or ""),
                 "result": content,
                 "id": message.id,
-            })
-
-    # Create a dictionary to map message ids to their corresponding messages
-    results_dict = {msg["actionExecutionId"]: msg for msg in result if "actionExecutionId" in msg}
-
+            }
 
     # since we are splitting multiple tool calls into multiple messages,
     # we need to reorder the corresponding result messages to be after the tool call
@@ -174,9 +179,8 @@ def langchain_messages_to_copilotkit(
 
     for msg in result:
 
-        # add all messages that are not tool call results
-        if not "actionExecutionId" in msg:
-            reordered_result.append(msg)
+        # tool call results are kept in results_dict and added after their tool call below
+        reordered_result.append(msg)
 
         # if the message is a tool call, also add the corresponding result message
         # immediately after the tool call
@@ -65,8 +65,12 @@ def langgraph_default_merge_state( # pylint: disable=unused-argument
         messages = messages[1:]
 
     existing_messages = state.get("messages", [])
-    existing_message_ids = {message.id for message in existing_messages}
-    new_messages = [message for message in messages if message.id not in existing_message_ids]
+    if existing_messages:
+        existing_message_ids = {message.id for message in existing_messages}
+        new_messages = [message for message in messages if message.id not in existing_message_ids]
+    else:
+        # nothing to deduplicate against
+        new_messages = messages
 
     return {
         **state,
@@ -76,6 +80,12 @@ def langgraph_default_merge_state( # pylint: disable=unused-argument
         }
     }
 
+_DEFAULT_EXCLUDE_KEYS = frozenset(("messages",))
+
+def _filter_state(state: dict, exclude_keys: frozenset = _DEFAULT_EXCLUDE_KEYS) -> dict:
+    """Filter out keys that should not be sent to the frontend as state"""
+    return {k: v for k, v in state.items() if k not in exclude_keys}
+
 class LangGraphAgent(Agent):
     """
     LangGraphAgent lets you define your agent for use with CopilotKit.
@@ -191,9 +201,7 @@ class LangGraphAgent(Agent):
             include_messages: bool = False
         ):
         if not include_messages:
-            state = {
-                k: v for k, v in state.items() if k != "messages"
-            }
+            state = _filter_state(state)
         else:
             state = {
                 **state,
@@ -222,7 +230,7 @@ class LangGraphAgent(Agent):
         actions: Optional[List[ActionDict]] = None,
         meta_events: Optional[List[MetaEvent]] = None
     ):
-        config = ensure_config(cast(Any, self.langgraph_config.copy()) if self.langgraph_config else {}) # pylint: disable=line-too-long
+        config = ensure_config(cast(Any, self.langgraph_config))
         config["configurable"] = config.get("configurable", {})
         config["configurable"]["thread_id"] = thread_id
 
@@ -281,6 +289,7 @@ class LangGraphAgent(Agent):
         emit_intermediate_state_until_end = None
         should_exit = False
         manually_emitted_state = None
+        checkpoint_state = None
         thread_id = cast(Any, config)["configurable"]["thread_id"]
 
         # Use provided input or fallback to initial_state
@@ -354,7 +363,14 @@ class LangGraphAgent(Agent):
                 # reset the streaming state extractor
                 streaming_state_extractor = _StreamingStateExtractor(emit_intermediate_state)
 
-            updated_state = manually_emitted_state or (await self.graph.aget_state(config)).values
+            # the checkpoint can't change while a chat model is streaming tokens,
+            # so we only fetch it again for other events
+            if not manually_emitted_state and (
+                checkpoint_state is None or event_type != "on_chat_model_stream"
+            ):
+                checkpoint_state = (await self.graph.aget_state(config)).values
+
+            updated_state = manually_emitted_state or checkpoint_state
 
             if emit_intermediate_state and event_type == "on_chat_model_stream":
                 streaming_state_extractor.buffer_tool_calls(event)
@@ -375,10 +391,11 @@ class LangGraphAgent(Agent):
             #   a) the state has changed
             #   b) the node has changed
             #   c) the node is ending
+            state_sync_event = ""
             if updated_state != state or prev_node_name != node_name or exiting_node:
                 state = updated_state
                 prev_node_name = node_name
-                yield self._emit_state_sync_event(
+                state_sync_event = self._emit_state_sync_event(
                     thread_id=thread_id,
                     run_id=run_id,
                     node_name=node_name,
@@ -387,10 +404,11 @@ class LangGraphAgent(Agent):
                     active=not exiting_node
                 ) + "\n"
 
-            yield langchain_dumps(event) + "\n"
+            # emit the state sync and the event as a single chunk
+            yield state_sync_event + langchain_dumps(event) + "\n"
 
         state = await self.graph.aget_state(config)
-        tasks = self.graph.get_state(config).tasks
+        tasks = state.tasks
         interrupts = tasks[0].interrupts if tasks and len(tasks) > 0 else None
         node_name = node_name if interrupts else list(state.metadata["writes"].keys())[0]
         is_end_node = state.next == () and not interrupts
@@ -412,12 +430,12 @@ class LangGraphAgent(Agent):
         *,
         thread_id: str,
     ):
-        config = ensure_config(cast(Any, self.langgraph_config.copy()) if self.langgraph_config else {}) # pylint: disable=line-too-long
+        config = ensure_config(cast(Any, self.langgraph_config))
         config["configurable"] = config.get("configurable", {})
         config["configurable"]["thread_id"] = thread_id
 
-        state = {**self.graph.get_state(config).values}
-        if state == {}:
+        values = self.graph.get_state(config).values
+        if not values:
             return {
                 "threadId": thread_id,
                 "threadExists": False,
@@ -425,8 +443,8 @@ class LangGraphAgent(Agent):
                 "messages": []
             }
 
-        messages = langchain_messages_to_copilotkit(state.get("messages", []))
-        del state["messages"]
+        messages = langchain_messages_to_copilotkit(values.get("messages", []))
+        state = _filter_state(values)
 
         return {
             "threadId": thread_id,
@@ -449,6 +467,16 @@ class _StreamingStateExtractor:
         self.current_tool_call = None
 
         self.previously_parsable_state = {}
+        self.previously_parsed_buffer = {}
+        self.parser = JSONParser()
+
+        # index the configs by tool name, the first config for a tool wins
+        self.emit_state_config_by_tool = {}
+        for config in emit_intermediate_state:
+            self.emit_state_config_by_tool.setdefault(
+                config.get("tool"),
+                (config.get("tool_argument"), config.get("state_key"))
+            )
 
     def buffer_tool_calls(self, event: Any):
         """Buffer the tool calls"""
@@ -464,22 +492,11 @@ class _StreamingStateExtractor:
 
     def get_emit_state_config(self, current_tool_name):
         """Get the emit state config"""
-
-        for config in self.emit_intermediate_state:
-            state_key = config.get("state_key")
-            tool = config.get("tool")
-            tool_argument = config.get("tool_argument")
-
-            if current_tool_name == tool:
-                return (tool_argument, state_key)
-
-        return (None, None)
+        return self.emit_state_config_by_tool.get(current_tool_name, (None, None))
 
 
     def extract_state(self):
         """Extract the streaming state"""
-        parser = JSONParser()
-
         state = {}
 
         for key, value in self.tool_call_buffer.items():
@@ -488,13 +505,18 @@ class _StreamingStateExtractor:
             if state_key is None:
                 continue
 
-            try:
-                parsed_value = parser.parse(value)
-            except Exception as _exc: # pylint: disable=broad-except
-                if key in self.previously_parsable_state:
-                    parsed_value = self.previously_parsable_state[key]
-                else:
-                    continue
+            if self.previously_parsed_buffer.get(key) == value:
+                # the buffer did not change since the last parse
+                parsed_value = self.previously_parsable_state[key]
+            else:
+                try:
+                    parsed_value = self.parser.parse(value)
+                    self.previously_parsed_buffer[key] = value
+                except Exception as _exc: # pylint: disable=broad-except
+                    if key in self.previously_parsable_state:
+                        parsed_value = self.previously_parsable_state[key]
+                    else:
+                        continue
 
             self.previously_parsable_state[key] = parsed_value
 
@@ -1,5 +1,6 @@
 """CopilotKit SDK"""
 
+import logging
 import warnings
 from importlib import metadata
 
@@ -334,6 +335,10 @@ class CopilotKitRemoteEndpoint:
         """
         Log request info
         """
+        # skip formatting the (potentially large) payloads when INFO is disabled
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
         logger.info(bold(title))
         logger.info("--------------------------")
         for key, value in data: